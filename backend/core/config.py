@@ -7,6 +7,10 @@ class Settings(BaseSettings):
     kalshi_api_key_id: str = ""
     kalshi_api_key: str = ""
     kalshi_env: str = "demo"  # 'demo' or 'prod'
+    kalshi_sign_algo: str = "auto"  # 'auto' | 'ed25519' | 'rsa'
+    # Run Base.metadata.create_all on startup. Handy in dev; disable in
+    # multi-worker deployments where N workers would race the DDL.
+    auto_create_schema: bool = True
 
     @property
     def kalshi_base_url(self) -> str:
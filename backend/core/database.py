@@ -1,9 +1,28 @@
+from contextlib import asynccontextmanager
+
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from core.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True)
-AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Pool sized for the API workers plus the scheduler; recycle well under
+# typical idle-connection timeouts so we never hand out a dead socket.
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Decode/encode JSONB (strategy configs, decision params) with orjson
+    # instead of stdlib json on every fetch.
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+)
 
 
 class Base(DeclarativeBase):
@@ -13,3 +32,14 @@ class Base(DeclarativeBase):
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+
+@asynccontextmanager
+async def ro_conn():
+    """Raw connection for read-only Core queries.
+
+    Skips the AsyncSession/identity-map setup that the ORM path pays —
+    use for hot GET endpoints that only project columns.
+    """
+    async with engine.connect() as conn:
+        yield conn
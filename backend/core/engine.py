@@ -14,12 +14,17 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from core.database import AsyncSessionLocal
 from core.kalshi import kalshi_client
 from models.db import Strategy, Decision, PortfolioSnapshot
-from strategies.base import get_strategy_class, TradeSignal
+from strategies.base import get_strategy_class, BaseStrategy, TradeSignal
 import strategies  # noqa — triggers all @register decorators
 
 logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler()
 
+# Strategy instances persist across scheduler ticks so they can memoize
+# state (parsed configs, last-seen markets). Cleared whenever strategies
+# are reloaded from the DB, since the config may have changed.
+_instances: dict[int, BaseStrategy] = {}
+
 
 async def run_strategy(strategy_id: int, strategy_name: str, config: dict):
     """Called by APScheduler for each enabled strategy."""
@@ -28,7 +33,9 @@ async def run_strategy(strategy_id: int, strategy_name: str, config: dict):
         logger.warning(f"No Python class registered for strategy '{strategy_name}'")
         return
 
-    instance = cls(config)
+    instance = _instances.get(strategy_id)
+    if instance is None:
+        instance = _instances[strategy_id] = cls(config)
     signal: TradeSignal = await instance.evaluate()
 
     order_id = None
@@ -38,7 +45,7 @@ async def run_strategy(strategy_id: int, strategy_name: str, config: dict):
                 ticker=signal.market_ticker,
                 side=signal.side,
                 count=signal.contracts,
-                price_cents=signal.params.get("price_cents", round(signal.contract_price * 100)),
+                price_cents=signal.params.get("price_cents", signal.contract_price),
             )
             order_id = resp.get("order", {}).get("order_id")
             logger.info(f"[{strategy_name}] Order placed: {order_id}")
@@ -69,10 +76,10 @@ async def snapshot_portfolio():
     """Record portfolio value every minute."""
     try:
         balance = await kalshi_client.get_balance()
-        cash = (balance.get("balance", 0)) / 100
+        cash = balance.get("balance", 0)  # integer cents
         positions = await kalshi_client.get_positions()
         pos_value = sum(
-            (p.get("market_exposure") or 0) / 100
+            (p.get("market_exposure") or 0)
             for p in positions
         )
         async with AsyncSessionLocal() as db:
@@ -88,29 +95,30 @@ async def snapshot_portfolio():
 
 async def load_and_schedule_strategies():
     """Pull enabled strategies from DB and schedule them."""
+    _instances.clear()
     async with AsyncSessionLocal() as db:
-        result = await db.execute(select(Strategy).where(Strategy.enabled == True))  # noqa: E712
-        rows = result.scalars().all()
-
-    for row in rows:
-        cls = get_strategy_class(row.name)
-        if cls is None:
-            logger.warning(f"Strategy '{row.name}' in DB has no registered Python class. Skipping.")
-            continue
-        interval = getattr(cls, "poll_interval_seconds", 15)
-        job_id = f"strategy_{row.id}"
-        if scheduler.get_job(job_id):
-            scheduler.remove_job(job_id)
-        scheduler.add_job(
-            run_strategy,
-            "interval",
-            seconds=interval,
-            id=job_id,
-            args=[row.id, row.name, row.config],
-            max_instances=1,
-            coalesce=True,
-        )
-        logger.info(f"Scheduled strategy '{row.name}' every {interval}s")
+        # Stream rather than materialize: each strategy is scheduled as its
+        # row arrives instead of waiting for the full result set.
+        result = await db.stream_scalars(select(Strategy).where(Strategy.enabled == True))  # noqa: E712
+        async for row in result:
+            cls = get_strategy_class(row.name)
+            if cls is None:
+                logger.warning(f"Strategy '{row.name}' in DB has no registered Python class. Skipping.")
+                continue
+            interval = getattr(cls, "poll_interval_seconds", 15)
+            job_id = f"strategy_{row.id}"
+            if scheduler.get_job(job_id):
+                scheduler.remove_job(job_id)
+            scheduler.add_job(
+                run_strategy,
+                "interval",
+                seconds=interval,
+                id=job_id,
+                args=[row.id, row.name, row.config],
+                max_instances=1,
+                coalesce=True,
+            )
+            logger.info(f"Scheduled strategy '{row.name}' every {interval}s")
 
     # Portfolio snapshot every 60s
     if not scheduler.get_job("portfolio_snapshot"):
@@ -125,3 +133,4 @@ async def start_engine():
 
 async def stop_engine():
     scheduler.shutdown(wait=False)
+    await kalshi_client.close()
@@ -2,23 +2,78 @@
 Kalshi REST API client.
 Uses RSA key-based auth as required by Kalshi's v2 API.
 """
+import asyncio
 import time
 import base64
 import hashlib
 import httpx
+import orjson
+from collections import defaultdict
 from typing import Optional
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, utils
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from core.config import settings
+from core.stats import api_stats
+
+
+# Header names and fixed endpoint paths, interned once instead of being
+# rebuilt on every call in the signing hot path.
+_H_KEY = "KALSHI-ACCESS-KEY"
+_H_TS = "KALSHI-ACCESS-TIMESTAMP"
+_H_SIG = "KALSHI-ACCESS-SIGNATURE"
+_PATH_BALANCE = "/portfolio/balance"
+_PATH_POSITIONS = "/portfolio/positions"
+_PATH_ORDERS = "/portfolio/orders"
+_PATH_MARKET = "/markets/"
+
+# Response-cache TTLs (seconds). Balance moves slowly between orders and
+# the per-series market list changes every 15 minutes; individual market
+# prices go stale fast.
+_TTL_DEFAULT = 1.0
+_TTL_BALANCE = 5.0
+_TTL_MARKET_LIST = 5.0
+_TTL_MARKET_DETAIL = 0.5
 
 
 class KalshiClient:
     def __init__(self):
         self.base_url = settings.kalshi_base_url
         self.key_id = settings.kalshi_api_key_id
+        self._sign_prefix = "/trade-api/v2"
         self._private_key_pem = settings.kalshi_api_key
         self._private_key = None
+        self._sign_algo = settings.kalshi_sign_algo
         self._load_key()
+        # Signature primitives are immutable — build them once instead of
+        # allocating padding/hash objects on every sign.
+        self._pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.DIGEST_LENGTH,
+        )
+        self._prehashed = utils.Prehashed(hashes.SHA256())
+        # RSA signing dominates per-call CPU; identical requests in the same
+        # millisecond (bursts inside one evaluate()) can reuse the signature.
+        self._sign_cache: dict[str, dict] = {}
+        # Short-TTL GET cache: strategies sharing a series collapse their
+        # duplicate polls into one API call. Keyed by full path incl. query.
+        self._resp_cache: dict[str, tuple[float, dict]] = {}
+        # Per-path locks coalesce a cache-miss stampede (N strategies on
+        # one series) into a single request; the rest hit the fresh cache.
+        self._get_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # One pooled client for the process — per-call AsyncClient construction
+        # costs a TCP+TLS handshake on every request. HTTP/2 multiplexes the
+        # per-evaluate burst over one connection (ALPN falls back to 1.1).
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
+    async def close(self):
+        """Release the pooled HTTP connections. Called on engine shutdown."""
+        await self._client.aclose()
 
     def _load_key(self):
         if not self._private_key_pem:
@@ -29,45 +84,98 @@ class KalshiClient:
             if not key_bytes.startswith(b"-----"):
                 key_bytes = base64.b64decode(key_bytes)
             self._private_key = serialization.load_pem_private_key(key_bytes, password=None)
+            if self._sign_algo == "auto":
+                self._sign_algo = (
+                    "ed25519" if isinstance(self._private_key, Ed25519PrivateKey) else "rsa"
+                )
         except Exception as e:
             print(f"[KalshiClient] Failed to load private key: {e}")
 
     def _sign(self, method: str, path: str, body: str = "") -> dict:
-        """Generate Kalshi HMAC-style RSA signature headers."""
+        """Generate Kalshi signature headers for an API-relative path.
+
+        The signed message covers the full API path (prefix included)
+        without the query string.
+        """
         ts = str(int(time.time() * 1000))
-        msg = ts + method.upper() + path + body
+        msg = ts + method.upper() + self._sign_prefix + path.split("?", 1)[0] + body
         if self._private_key is None:
             return {}
-        sig = self._private_key.sign(msg.encode(), padding.PKCS1v15(), hashes.SHA256())
-        return {
-            "KALSHI-ACCESS-KEY": self.key_id,
-            "KALSHI-ACCESS-TIMESTAMP": ts,
-            "KALSHI-ACCESS-SIGNATURE": base64.b64encode(sig).decode(),
+        cached = self._sign_cache.get(msg)
+        if cached is not None:
+            return cached
+        if self._sign_algo == "ed25519":
+            # Ed25519 signing is ~an order of magnitude cheaper than RSA.
+            sig = self._private_key.sign(msg.encode("ascii"))
+        else:
+            # Pre-hash once and hand cryptography the digest directly.
+            digest = hashlib.sha256(msg.encode("ascii")).digest()
+            sig = self._private_key.sign(digest, self._pss, self._prehashed)
+        headers = {
+            _H_KEY: self.key_id,
+            _H_TS: ts,
+            _H_SIG: base64.b64encode(sig).decode(),
         }
+        if len(self._sign_cache) >= 64:
+            # Timestamps are millisecond-granular, so old entries are dead
+            # within a tick; evict the oldest (dicts keep insertion order).
+            self._sign_cache.pop(next(iter(self._sign_cache)))
+        self._sign_cache[msg] = headers
+        return headers
+
+    async def _get(self, path: str) -> dict:
+        if path == _PATH_BALANCE:
+            ttl = _TTL_BALANCE
+        elif path.startswith("/markets?"):
+            ttl = _TTL_MARKET_LIST
+        elif path.startswith(_PATH_MARKET):
+            ttl = _TTL_MARKET_DETAIL
+        else:
+            ttl = _TTL_DEFAULT
+        cached = self._resp_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        async with self._get_locks[path]:
+            # Re-check after the wait: a coalesced peer may have refreshed.
+            cached = self._resp_cache.get(path)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            headers = self._sign("GET", path)
+            label = path.split("?", 1)[0]
+            start = time.perf_counter()
+            error = False
+            try:
+                r = await self._client.get(path, headers=headers)
+                r.raise_for_status()
+                data = r.json()
+                if len(self._resp_cache) >= 64:
+                    # Evict the oldest entry and its coalescing lock — market
+                    # detail paths embed the ticker, and a fresh ticker
+                    # appears every interval, so the lock map would otherwise
+                    # grow without bound.
+                    evicted = next(iter(self._resp_cache))
+                    self._resp_cache.pop(evicted)
+                    self._get_locks.pop(evicted, None)
+                self._resp_cache[path] = (time.monotonic(), data)
+                return data
+            except Exception:
+                error = True
+                # Failed paths never enter the cache, so drop the lock here
+                # rather than leak it; in-flight waiters keep their reference.
+                self._get_locks.pop(path, None)
+                raise
+            finally:
+                api_stats.record(label, (time.perf_counter() - start) * 1000, error=error)
 
     async def get_markets(self, series_ticker: str, status: str = "open") -> list[dict]:
         path = f"/markets?series_ticker={series_ticker}&status={status}&limit=20"
-        headers = self._sign("GET", f"/trade-api/v2{path}")
-        async with httpx.AsyncClient() as client:
-            r = await client.get(f"{self.base_url}{path}", headers=headers, timeout=10)
-            r.raise_for_status()
-            return r.json().get("markets", [])
+        return (await self._get(path)).get("markets", [])
 
     async def get_market(self, ticker: str) -> dict:
-        path = f"/markets/{ticker}"
-        headers = self._sign("GET", f"/trade-api/v2{path}")
-        async with httpx.AsyncClient() as client:
-            r = await client.get(f"{self.base_url}{path}", headers=headers, timeout=10)
-            r.raise_for_status()
-            return r.json().get("market", {})
+        return (await self._get(_PATH_MARKET + ticker)).get("market", {})
 
     async def get_balance(self) -> dict:
-        path = "/portfolio/balance"
-        headers = self._sign("GET", f"/trade-api/v2{path}")
-        async with httpx.AsyncClient() as client:
-            r = await client.get(f"{self.base_url}{path}", headers=headers, timeout=10)
-            r.raise_for_status()
-            return r.json()
+        return await self._get(_PATH_BALANCE)
 
     async def place_order(
         self,
@@ -78,8 +186,7 @@ class KalshiClient:
         action: str = "buy",
         order_type: str = "limit",
     ) -> dict:
-        path = "/portfolio/orders"
-        import json
+        path = _PATH_ORDERS
         body_dict = {
             "ticker": ticker,
             "action": action,
@@ -89,20 +196,25 @@ class KalshiClient:
             "yes_price": price_cents if side == "yes" else 100 - price_cents,
             "no_price": price_cents if side == "no" else 100 - price_cents,
         }
-        body = json.dumps(body_dict)
-        headers = {**self._sign("POST", f"/trade-api/v2{path}", body), "Content-Type": "application/json"}
-        async with httpx.AsyncClient() as client:
-            r = await client.post(f"{self.base_url}{path}", content=body, headers=headers, timeout=10)
+        body_bytes = orjson.dumps(body_dict)
+        headers = {**self._sign("POST", path, body_bytes.decode()), "Content-Type": "application/json"}
+        start = time.perf_counter()
+        error = False
+        try:
+            r = await self._client.post(path, content=body_bytes, headers=headers)
             r.raise_for_status()
+            # Balance/positions change once an order lands — drop them.
+            for key in [k for k in self._resp_cache if k.startswith("/portfolio")]:
+                del self._resp_cache[key]
             return r.json()
+        except Exception:
+            error = True
+            raise
+        finally:
+            api_stats.record(path, (time.perf_counter() - start) * 1000, error=error)
 
     async def get_positions(self) -> list[dict]:
-        path = "/portfolio/positions"
-        headers = self._sign("GET", f"/trade-api/v2{path}")
-        async with httpx.AsyncClient() as client:
-            r = await client.get(f"{self.base_url}{path}", headers=headers, timeout=10)
-            r.raise_for_status()
-            return r.json().get("market_positions", [])
+        return (await self._get(_PATH_POSITIONS)).get("market_positions", [])
 
 
 kalshi_client = KalshiClient()
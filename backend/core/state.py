@@ -0,0 +1,51 @@
+"""
+Latest market snapshot shared between strategies and the dashboard.
+
+Strategies write from the scheduler loop and HTTP handlers read
+concurrently. Instead of locking, update() builds a complete new
+snapshot and publishes it with a single reference assignment — atomic
+under the GIL — so readers never see a half-written state. Published
+snapshots are never mutated afterwards.
+"""
+from datetime import datetime, timezone
+
+import orjson
+
+
+class MarketState:
+    def __init__(self):
+        self._snapshot: dict = {}
+        self._json: bytes = b"{}"
+
+    def update(
+        self,
+        *,
+        ticker: str,
+        yes_price: float | None = None,
+        no_price: float | None = None,
+        seconds_remaining: int | None = None,
+        close_time: str | None = None,
+        strategy: str | None = None,
+    ):
+        snapshot = {
+            "ticker": ticker,
+            "yes_price": yes_price,
+            "no_price": no_price,
+            "seconds_remaining": seconds_remaining,
+            "close_time": close_time,
+            "strategy": strategy,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._snapshot = snapshot
+        # Encode once at write time — the dashboard GET is then just a
+        # pointer return of the cached bytes.
+        self._json = orjson.dumps(snapshot)
+
+    def to_dict(self) -> dict:
+        return self._snapshot
+
+    def to_json(self) -> bytes:
+        return self._json
+
+
+market_state = MarketState()
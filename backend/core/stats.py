@@ -0,0 +1,48 @@
+"""
+Per-endpoint API call statistics.
+
+record() sits on the hot path of every Kalshi request. Counters are
+kept as three parallel flat defaultdicts (structure-of-arrays) rather
+than a dict of per-label dicts: a scalar defaultdict increment is a
+single lookup + add, and iterating the flat maps in summary() stays
+cache-friendly as label count grows. All mutation happens on the
+event-loop thread, so no locking is needed.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+
+
+class ApiStats:
+    def __init__(self):
+        self._started = datetime.now(timezone.utc)
+        self._calls: defaultdict[str, int] = defaultdict(int)
+        self._errors: defaultdict[str, int] = defaultdict(int)
+        self._total_ms: defaultdict[str, float] = defaultdict(float)
+
+    def record(self, label: str, elapsed_ms: float, error: bool = False):
+        self._calls[label] += 1
+        self._total_ms[label] += elapsed_ms
+        if error:
+            self._errors[label] += 1
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            label: {
+                "calls": calls,
+                "errors": self._errors[label],
+                "total_ms": round(self._total_ms[label], 1),
+                "avg_ms": round(self._total_ms[label] / calls, 1) if calls else 0.0,
+            }
+            for label, calls in self._calls.items()
+        }
+
+    def totals(self) -> dict:
+        uptime_s = (datetime.now(timezone.utc) - self._started).total_seconds()
+        return {
+            "total_calls": sum(self._calls.values()),
+            "total_errors": sum(self._errors.values()),
+            "uptime_s": int(uptime_s),
+        }
+
+
+api_stats = ApiStats()
@@ -1,16 +1,22 @@
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
 from pydantic import BaseModel
 from typing import Optional
-import json
+import msgspec
 
-from core.database import get_db, engine
+from core.config import settings
+from core.database import get_db, ro_conn, engine
 from core.engine import start_engine, stop_engine, load_and_schedule_strategies
 from core.kalshi import kalshi_client
+from core.stats import api_stats
+from core.state import market_state
 from models.db import Strategy, Decision, PortfolioSnapshot, Base
 from strategies.base import all_registered
 
@@ -20,14 +26,20 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if settings.auto_create_schema:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
     await start_engine()
     yield
     await stop_engine()
 
 
-app = FastAPI(title="Kalshi Trader", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Kalshi Trader",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -51,6 +63,54 @@ class StrategyCreate(BaseModel):
     config: dict = {}
 
 
+# Response rows for the hot GET endpoints: msgspec structs encode to JSON
+# bytes in C, skipping FastAPI's jsonable_encoder walk and stdlib json.
+# gc=False keeps the rows out of the cyclic GC — they never form cycles,
+# and large lists of tracked objects make collections measurably slower.
+
+class PortfolioRow(msgspec.Struct, gc=False):
+    id: int
+    cash: int  # integer cents, like everything money-valued in the API
+    positions_value: int
+    total_value: int
+    created_at: str
+
+
+class StrategyRow(msgspec.Struct, gc=False):
+    id: int
+    name: str
+    description: Optional[str]
+    enabled: bool
+    config: dict
+    has_class: bool
+    poll_interval_seconds: Optional[int]
+    created_at: str
+
+
+class DecisionRow(msgspec.Struct, gc=False):
+    id: int
+    strategy_id: Optional[int]
+    market_ticker: str
+    side: str
+    action: str
+    reason: Optional[str]
+    contract_price: Optional[int]
+    time_remaining_seconds: Optional[int]
+    portfolio_cash: Optional[int]
+    position_size: Optional[int]
+    contracts: Optional[int]
+    order_id: Optional[str]
+    params: dict
+    created_at: str
+
+
+_ENCODER = msgspec.json.Encoder()
+
+
+def _json_response(rows) -> Response:
+    return Response(content=_ENCODER.encode(rows), media_type="application/json")
+
+
 # ── Portfolio ─────────────────────────────────────────────────────────────────
 
 @app.get("/api/portfolio")
@@ -59,53 +119,88 @@ async def get_portfolio():
     try:
         balance = await kalshi_client.get_balance()
         positions = await kalshi_client.get_positions()
-        return {"balance": balance, "positions": positions}
+        # Returning a Response directly skips FastAPI's jsonable_encoder
+        # walk over the (already JSON-shaped) Kalshi payloads.
+        return ORJSONResponse({"balance": balance, "positions": positions})
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
 
 
 @app.get("/api/portfolio/history")
-async def get_portfolio_history(limit: int = 120, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(PortfolioSnapshot).order_by(desc(PortfolioSnapshot.created_at)).limit(limit)
+async def get_portfolio_history(limit: int = 120, after_id: Optional[int] = None):
+    limit = min(limit, 1000)  # keep memory bounded under abusive limits
+    # Project columns instead of hydrating ORM instances, and let SQL
+    # return the window oldest-first rather than reversing in Python.
+    inner = (
+        select(
+            PortfolioSnapshot.id,
+            PortfolioSnapshot.cash,
+            PortfolioSnapshot.positions_value,
+            PortfolioSnapshot.total_value,
+            PortfolioSnapshot.created_at,
+        )
+        .order_by(desc(PortfolioSnapshot.created_at))
+        .limit(limit)
     )
-    rows = result.scalars().all()
-    return [
-        {
-            "id": r.id,
-            "cash": float(r.cash or 0),
-            "positions_value": float(r.positions_value or 0),
-            "total_value": float(r.total_value or 0),
-            "created_at": r.created_at.isoformat(),
-        }
-        for r in reversed(rows)
-    ]
+    if after_id is not None:
+        # Keyset-style incremental poll: only rows the client hasn't seen.
+        inner = inner.where(PortfolioSnapshot.id > after_id)
+    latest = inner.subquery()
+    async with ro_conn() as conn:
+        result = await conn.execute(select(latest).order_by(latest.c.created_at))
+    # Positional construction — no kwargs dict per row.
+    return _json_response([
+        PortfolioRow(
+            r.id,
+            r.cash or 0,
+            r.positions_value or 0,
+            r.total_value or 0,
+            r.created_at.isoformat(),
+        )
+        for r in result.all()
+    ])
 
 
 # ── Strategies ────────────────────────────────────────────────────────────────
 
+# Strategies rarely change — serve cached encoded bytes until a write
+# (PATCH/POST below) invalidates them. The generation counter stops a GET
+# that read rows before a concurrent write from caching pre-write state.
+_strategies_json_cache: Optional[bytes] = None
+_strategies_cache_gen = 0
+
+
 @app.get("/api/strategies")
 async def list_strategies(db: AsyncSession = Depends(get_db)):
+    global _strategies_json_cache
+    if _strategies_json_cache is not None:
+        return Response(content=_strategies_json_cache, media_type="application/json")
+    gen = _strategies_cache_gen
     result = await db.execute(select(Strategy).order_by(Strategy.id))
     rows = result.scalars().all()
     registered = all_registered()
-    return [
-        {
-            "id": r.id,
-            "name": r.name,
-            "description": r.description,
-            "enabled": r.enabled,
-            "config": r.config,
-            "has_class": r.name in registered,
-            "poll_interval_seconds": getattr(registered.get(r.name), "poll_interval_seconds", None),
-            "created_at": r.created_at.isoformat(),
-        }
+    intervals = {n: getattr(c, "poll_interval_seconds", None) for n, c in registered.items()}
+    encoded = _ENCODER.encode([
+        StrategyRow(
+            r.id,
+            r.name,
+            r.description,
+            r.enabled,
+            r.config,
+            r.name in registered,
+            intervals.get(r.name),
+            r.created_at.isoformat(),
+        )
         for r in rows
-    ]
+    ])
+    if gen == _strategies_cache_gen:
+        _strategies_json_cache = encoded
+    return Response(content=encoded, media_type="application/json")
 
 
 @app.patch("/api/strategies/{strategy_id}")
 async def update_strategy(strategy_id: int, body: StrategyUpdate, db: AsyncSession = Depends(get_db)):
+    global _strategies_json_cache, _strategies_cache_gen
     result = await db.execute(select(Strategy).where(Strategy.id == strategy_id))
     row = result.scalar_one_or_none()
     if not row:
@@ -117,6 +212,8 @@ async def update_strategy(strategy_id: int, body: StrategyUpdate, db: AsyncSessi
     if body.description is not None:
         row.description = body.description
     await db.commit()
+    _strategies_cache_gen += 1
+    _strategies_json_cache = None
     # Reschedule
     await load_and_schedule_strategies()
     return {"ok": True}
@@ -124,9 +221,12 @@ async def update_strategy(strategy_id: int, body: StrategyUpdate, db: AsyncSessi
 
 @app.post("/api/strategies")
 async def create_strategy(body: StrategyCreate, db: AsyncSession = Depends(get_db)):
+    global _strategies_json_cache, _strategies_cache_gen
     s = Strategy(name=body.name, description=body.description, enabled=body.enabled, config=body.config)
     db.add(s)
     await db.commit()
+    _strategies_cache_gen += 1
+    _strategies_json_cache = None
     await load_and_schedule_strategies()
     return {"ok": True, "id": s.id}
 
@@ -134,40 +234,79 @@ async def create_strategy(body: StrategyCreate, db: AsyncSession = Depends(get_d
 # ── Decisions ─────────────────────────────────────────────────────────────────
 
 @app.get("/api/decisions")
-async def list_decisions(limit: int = 100, action: Optional[str] = None, db: AsyncSession = Depends(get_db)):
-    q = select(Decision).order_by(desc(Decision.created_at)).limit(limit)
+async def list_decisions(
+    limit: int = 100,
+    action: Optional[str] = None,
+    after_id: Optional[int] = None,
+):
+    limit = min(limit, 1000)
+    q = (
+        select(
+            Decision.id,
+            Decision.strategy_id,
+            Decision.market_ticker,
+            Decision.side,
+            Decision.action,
+            Decision.reason,
+            Decision.contract_price,
+            Decision.time_remaining_seconds,
+            Decision.portfolio_cash,
+            Decision.position_size,
+            Decision.contracts,
+            Decision.order_id,
+            Decision.params,
+            Decision.created_at,
+        )
+        .order_by(desc(Decision.created_at))
+        .limit(limit)
+    )
     if action:
         q = q.where(Decision.action == action)
-    result = await db.execute(q)
-    rows = result.scalars().all()
-    return [
-        {
-            "id": r.id,
-            "strategy_id": r.strategy_id,
-            "market_ticker": r.market_ticker,
-            "side": r.side,
-            "action": r.action,
-            "reason": r.reason,
-            "contract_price": float(r.contract_price) if r.contract_price else None,
-            "time_remaining_seconds": r.time_remaining_seconds,
-            "portfolio_cash": float(r.portfolio_cash) if r.portfolio_cash else None,
-            "position_size": float(r.position_size) if r.position_size else None,
-            "contracts": r.contracts,
-            "order_id": r.order_id,
-            "params": r.params,
-            "created_at": r.created_at.isoformat(),
-        }
+    if after_id is not None:
+        q = q.where(Decision.id > after_id)
+    async with ro_conn() as conn:
+        result = await conn.execute(q)
+    rows = result.all()
+    return _json_response([
+        DecisionRow(
+            r.id,
+            r.strategy_id,
+            r.market_ticker,
+            r.side,
+            r.action,
+            r.reason,
+            r.contract_price,
+            r.time_remaining_seconds,
+            r.portfolio_cash,
+            r.position_size,
+            r.contracts,
+            r.order_id,
+            r.params,
+            r.created_at.isoformat(),
+        )
         for r in rows
-    ]
+    ])
+
+
+# Dashboard clients poll stats constantly; a 10s cache collapses the
+# concurrent polls into one DB round-trip. The lock coalesces refreshes.
+_stats_cache = {"ts": 0.0, "val": None}
+_stats_lock = asyncio.Lock()
 
 
 @app.get("/api/decisions/stats")
-async def decision_stats(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(
-        select(Decision.action, func.count(Decision.id)).group_by(Decision.action)
-    )
-    counts = {row[0]: row[1] for row in result.all()}
-    return counts
+async def decision_stats():
+    async with _stats_lock:
+        if _stats_cache["val"] is not None and time.monotonic() - _stats_cache["ts"] < 10:
+            return ORJSONResponse(_stats_cache["val"])
+        async with ro_conn() as conn:
+            result = await conn.execute(
+                select(Decision.action, func.count(Decision.id)).group_by(Decision.action)
+            )
+        counts = {row[0]: row[1] for row in result.all()}
+        _stats_cache["ts"] = time.monotonic()
+        _stats_cache["val"] = counts
+        return ORJSONResponse(counts)
 
 
 # ── Markets ───────────────────────────────────────────────────────────────────
@@ -176,11 +315,23 @@ async def decision_stats(db: AsyncSession = Depends(get_db)):
 async def get_markets(series: str):
     try:
         markets = await kalshi_client.get_markets(series)
-        return markets
+        return ORJSONResponse(markets)
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
 
 
+@app.get("/api/market-state")
+async def get_market_state():
+    """Latest market snapshot written by the strategies."""
+    return Response(content=market_state.to_json(), media_type="application/json")
+
+
+@app.get("/api/api-stats")
+async def get_api_stats():
+    """Call counts and latency per Kalshi endpoint."""
+    return ORJSONResponse({"endpoints": api_stats.summary(), **api_stats.totals()})
+
+
 @app.get("/api/health")
 async def health():
     return {"status": "ok"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, Boolean, Numeric, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from core.database import Base
@@ -23,20 +23,34 @@ class Decision(Base):
     side = Column(Text, nullable=False)
     action = Column(Text, nullable=False)
     reason = Column(Text)
-    contract_price = Column(Numeric(10, 4))
+    # Money is integer cents throughout — Kalshi's native unit, and no
+    # Decimal objects to hydrate/convert on every API row.
+    contract_price = Column(Integer)
     time_remaining_seconds = Column(Integer)
-    portfolio_cash = Column(Numeric(14, 2))
-    position_size = Column(Numeric(14, 2))
+    portfolio_cash = Column(Integer)
+    position_size = Column(Integer)
     contracts = Column(Integer)
     order_id = Column(Text)
     params = Column(JSONB, nullable=False, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # The dashboard reads are ORDER BY created_at DESC LIMIT N, optionally
+    # filtered by action — both become index range scans.
+    __table_args__ = (
+        Index("ix_decisions_created_at", created_at.desc()),
+        Index("ix_decisions_action_created_at", action, created_at.desc()),
+    )
+
 
 class PortfolioSnapshot(Base):
     __tablename__ = "portfolio_snapshots"
     id = Column(Integer, primary_key=True)
-    cash = Column(Numeric(14, 2))
-    positions_value = Column(Numeric(14, 2))
-    total_value = Column(Numeric(14, 2))
+    # Integer cents, same as decisions.
+    cash = Column(Integer)
+    positions_value = Column(Integer)
+    total_value = Column(Integer)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_portfolio_snapshots_created_at", created_at.desc()),
+    )
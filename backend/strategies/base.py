@@ -22,10 +22,11 @@ class TradeSignal:
     action: str  # 'buy' | 'skip' | 'error'
     side: Optional[str] = None  # 'yes' | 'no'
     market_ticker: Optional[str] = None
-    contract_price: Optional[float] = None
+    # Money fields are integer cents — Kalshi's native unit.
+    contract_price: Optional[int] = None
     time_remaining_seconds: Optional[int] = None
-    portfolio_cash: Optional[float] = None
-    position_size: Optional[float] = None
+    portfolio_cash: Optional[int] = None
+    position_size: Optional[int] = None
     contracts: Optional[int] = None
     reason: str = ""
     params: dict = None
@@ -85,4 +86,5 @@ def get_strategy_class(name: str) -> Optional[type[BaseStrategy]]:
 
 
 def all_registered() -> dict[str, type[BaseStrategy]]:
-    return dict(_REGISTRY)
+    """The live registry — treat as read-only; don't mutate."""
+    return _REGISTRY
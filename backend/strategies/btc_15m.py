@@ -8,10 +8,34 @@ Config keys (set in strategies.config JSONB):
     max_seconds_remaining int   60
     position_pct        float   0.05  (5% of cash)
 """
-from datetime import datetime, timezone
+import asyncio
+import time
+from datetime import datetime
+from functools import lru_cache
 from strategies.base import BaseStrategy, TradeSignal, register
 from core.kalshi import kalshi_client
-import math
+from core.state import market_state
+
+try:
+    import ciso8601  # ~5x faster than datetime.fromisoformat, handles 'Z'
+except ImportError:
+    ciso8601 = None
+
+
+@lru_cache(maxsize=4096)
+def _parse_time(ts: str | None) -> float | None:
+    """Parse a Kalshi ISO timestamp to a Unix timestamp. Markets repeat
+    across polls, so the same strings come back every 10s — memoize on the
+    raw string. Returning a float keeps the time-remaining math a plain
+    subtraction against time.time() instead of datetime arithmetic."""
+    if not ts:
+        return None
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime(ts).timestamp()
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except Exception:
+        return None
 
 
 @register
@@ -26,8 +50,20 @@ class BTC15mHighConfidence(BaseStrategy):
         self.threshold = float(db_config.get("min_price_threshold", 0.90))
         self.max_seconds = int(db_config.get("max_seconds_remaining", 60))
         self.position_pct = float(db_config.get("position_pct", 0.05))
+        # Basis points, so sizing below stays in pure integer math.
+        self.position_pct_bp = int(round(self.position_pct * 10000))
+        # Candidate window for markets not matched by title (see
+        # _find_target_market) — one interval plus slack.
+        self._window_seconds = self.interval * 60 + 30
 
     async def evaluate(self) -> TradeSignal:
+        # Balance doesn't depend on any market lookup — fetch it in the
+        # background from the start and only await it if we get to sizing.
+        balance_task = asyncio.create_task(kalshi_client.get_balance())
+        # Retrieve the outcome even when a skip path abandons the task, so
+        # a failed balance call can't log "Task exception was never
+        # retrieved" instead of the strategy's own error handling.
+        balance_task.add_done_callback(lambda t: t.cancelled() or t.exception())
         try:
             # 1. Get open markets for this series
             markets = await kalshi_client.get_markets(self.series, status="open")
@@ -35,7 +71,8 @@ class BTC15mHighConfidence(BaseStrategy):
                 return TradeSignal(action="skip", reason="No open markets found")
 
             # 2. Find the active 15-min market closest to expiry
-            target = self._find_target_market(markets)
+            now = time.time()
+            target = self._find_target_market(markets, now)
             if not target:
                 return TradeSignal(
                     action="skip",
@@ -43,12 +80,12 @@ class BTC15mHighConfidence(BaseStrategy):
                 )
 
             ticker = target["ticker"]
-            close_time = self._parse_time(target.get("close_time") or target.get("expiration_time"))
-            if close_time is None:
+            close_iso = target.get("close_time") or target.get("expiration_time")
+            close_ts = _parse_time(close_iso)
+            if close_ts is None:
                 return TradeSignal(action="skip", reason="Could not parse market close time")
 
-            now = datetime.now(timezone.utc)
-            seconds_remaining = int((close_time - now).total_seconds())
+            seconds_remaining = int(close_ts - now)
 
             # 3. Check time condition
             if seconds_remaining > self.max_seconds or seconds_remaining < 0:
@@ -65,6 +102,14 @@ class BTC15mHighConfidence(BaseStrategy):
             no_price = (detail.get("no_ask") or detail.get("no_bid") or 0) / 100
 
             self.log(f"{ticker} | yes={yes_price:.2f} no={no_price:.2f} | {seconds_remaining}s left")
+            market_state.update(
+                ticker=ticker,
+                yes_price=yes_price,
+                no_price=no_price,
+                seconds_remaining=seconds_remaining,
+                close_time=close_iso,
+                strategy=self.name,
+            )
 
             # 5. Check price condition
             side = None
@@ -78,28 +123,28 @@ class BTC15mHighConfidence(BaseStrategy):
                 return TradeSignal(
                     action="skip",
                     market_ticker=ticker,
-                    contract_price=max(yes_price, no_price),
+                    contract_price=round(max(yes_price, no_price) * 100),
                     time_remaining_seconds=seconds_remaining,
                     reason=f"Neither side meets threshold (yes={yes_price:.2f}, no={no_price:.2f} < {self.threshold})"
                 )
 
             # 6. Size position
-            balance = await kalshi_client.get_balance()
+            balance = await balance_task
             # Kalshi returns balance in cents
             cash_cents = balance.get("balance", 0)
-            cash = cash_cents / 100
-            spend = cash * self.position_pct
             price_cents = round(price * 100)
-            contracts = max(1, math.floor((spend * 100) / price_cents))
+            # Integer cents throughout — no float rounding at the boundaries.
+            spend_cents = (cash_cents * self.position_pct_bp) // 10000
+            contracts = max(1, spend_cents // price_cents)
 
             return TradeSignal(
                 action="buy",
                 side=side,
                 market_ticker=ticker,
-                contract_price=price,
+                contract_price=price_cents,
                 time_remaining_seconds=seconds_remaining,
-                portfolio_cash=cash,
-                position_size=round((contracts * price_cents) / 100, 2),
+                portfolio_cash=cash_cents,
+                position_size=contracts * price_cents,
                 contracts=contracts,
                 reason=f"{side.upper()} @ {price:.2f} with {seconds_remaining}s remaining",
                 params={
@@ -112,46 +157,40 @@ class BTC15mHighConfidence(BaseStrategy):
         except Exception as e:
             self.log(f"ERROR: {e}")
             return TradeSignal(action="error", reason=str(e))
+        finally:
+            # Skip paths bail before sizing — don't let the balance call
+            # run on (and count against api_stats) for nothing.
+            if not balance_task.done():
+                balance_task.cancel()
 
-    def _find_target_market(self, markets: list[dict]) -> dict | None:
+    def _find_target_market(self, markets: list[dict], now: float) -> dict | None:
         """Find the 15-min market closest to (but not past) expiry."""
-        now = datetime.now(timezone.utc)
-        candidates = []
+        window = self._window_seconds
+        # Single pass: parse each market's close time once and track the
+        # best (soonest) candidate directly instead of sorting a list.
+        best_delta = best = None
+        fallback_delta = fallback = None
         for m in markets:
+            close = _parse_time(m.get("close_time") or m.get("expiration_time"))
+            if close is None:
+                continue
+            delta = close - now
+            if delta <= 0:
+                continue
             title = (m.get("title") or m.get("subtitle") or "").lower()
-            if f"{self.interval}" not in title and f"{self.interval}min" not in (m.get("series_ticker") or "").lower():
-                # Try to match by expiry interval — markets spaced 15 min apart
-                close = self._parse_time(m.get("close_time") or m.get("expiration_time"))
-                if close:
-                    delta = (close - now).total_seconds()
-                    if 0 < delta <= self.interval * 60 + 30:
-                        candidates.append((delta, m))
-            else:
-                close = self._parse_time(m.get("close_time") or m.get("expiration_time"))
-                if close:
-                    delta = (close - now).total_seconds()
-                    if delta > 0:
-                        candidates.append((delta, m))
-
-        if not candidates:
-            # Fall back: just use the soonest expiring open market
-            for m in markets:
-                close = self._parse_time(m.get("close_time") or m.get("expiration_time"))
-                if close:
-                    delta = (close - now).total_seconds()
-                    if delta > 0:
-                        candidates.append((delta, m))
-
-        if not candidates:
-            return None
-        candidates.sort(key=lambda x: x[0])
-        return candidates[0][1]
-
-    @staticmethod
-    def _parse_time(ts: str | None) -> datetime | None:
-        if not ts:
-            return None
-        try:
-            return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        except Exception:
-            return None
+            matches_interval = (
+                f"{self.interval}" in title
+                or f"{self.interval}min" in (m.get("series_ticker") or "").lower()
+            )
+            # Markets matching the interval qualify outright; others only if
+            # they expire within one interval (markets spaced 15 min apart).
+            if (matches_interval or delta <= window) and (
+                best_delta is None or delta < best_delta
+            ):
+                best_delta, best = delta, m
+            # Fall back: the soonest expiring open market
+            if fallback_delta is None or delta < fallback_delta:
+                fallback_delta, fallback = delta, m
+
+        return best if best is not None else fallback
+
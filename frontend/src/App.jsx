@@ -336,7 +336,13 @@ export default function App() {
         api.strategies(),
       ])
       setPortfolio(p)
-      setHistory(h)
+      // API money fields are integer cents — convert for display once here
+      setHistory(h.map(r => ({
+        ...r,
+        cash: r.cash / 100,
+        positions_value: r.positions_value / 100,
+        total_value: r.total_value / 100,
+      })))
       setDecisions(d)
       setStats(s)
       setStrategies(st)
@@ -535,7 +541,7 @@ export default function App() {
                       <SideIndicator side={d.side} />
                       <span style={{ fontFamily: 'var(--mono)', fontSize: 11, color: 'var(--text2)', flex: 1 }}>{d.market_ticker}</span>
                       {d.contract_price && (
-                        <span style={{ fontFamily: 'var(--mono)', fontSize: 11, color: 'var(--text2)' }}>{(d.contract_price * 100).toFixed(0)}¢</span>
+                        <span style={{ fontFamily: 'var(--mono)', fontSize: 11, color: 'var(--text2)' }}>{d.contract_price}¢</span>
                       )}
                       {d.time_remaining_seconds != null && (
                         <span style={{ fontFamily: 'var(--mono)', fontSize: 10, color: 'var(--text3)' }}>{d.time_remaining_seconds}s</span>
@@ -614,13 +620,13 @@ export default function App() {
                           <td style={{ padding: '7px 12px' }}><SideIndicator side={d.side} /></td>
                           <td style={{ padding: '7px 12px', fontFamily: 'var(--mono)', fontSize: 11 }}>{d.market_ticker}</td>
                           <td style={{ padding: '7px 12px', fontFamily: 'var(--mono)', fontSize: 11, color: 'var(--text2)' }}>
-                            {d.contract_price ? `${(d.contract_price * 100).toFixed(0)}¢` : '—'}
+                            {d.contract_price ? `${d.contract_price}¢` : '—'}
                           </td>
                           <td style={{ padding: '7px 12px', fontFamily: 'var(--mono)', fontSize: 11, color: 'var(--text2)' }}>
                             {d.time_remaining_seconds ?? '—'}
                           </td>
                           <td style={{ padding: '7px 12px', fontFamily: 'var(--mono)', fontSize: 11 }}>{d.contracts ?? '—'}</td>
-                          <td style={{ padding: '7px 12px', fontFamily: 'var(--mono)', fontSize: 11 }}>{d.position_size ? fmt$(d.position_size) : '—'}</td>
+                          <td style={{ padding: '7px 12px', fontFamily: 'var(--mono)', fontSize: 11 }}>{d.position_size ? fmt$(d.position_size / 100) : '—'}</td>
                           <td style={{ padding: '7px 12px', fontSize: 11, color: 'var(--text3)', maxWidth: 260, overflow: 'hidden', textOverflow: 'ellipsis', whiteSpace: 'nowrap' }}>{d.reason}</td>
                         </tr>
                       ))}
@@ -17,10 +17,11 @@ CREATE TABLE IF NOT EXISTS decisions (
     side TEXT NOT NULL CHECK (side IN ('yes', 'no')),
     action TEXT NOT NULL CHECK (action IN ('buy', 'skip', 'error')),
     reason TEXT,
-    contract_price NUMERIC(10,4),
+    -- money columns are integer cents (Kalshi's native unit)
+    contract_price INTEGER,
     time_remaining_seconds INTEGER,
-    portfolio_cash NUMERIC(14,2),
-    position_size NUMERIC(14,2),
+    portfolio_cash INTEGER,
+    position_size INTEGER,
     contracts INTEGER,
     order_id TEXT,
     params JSONB NOT NULL DEFAULT '{}',
@@ -30,12 +31,17 @@ CREATE TABLE IF NOT EXISTS decisions (
 -- Portfolio snapshots for charting
 CREATE TABLE IF NOT EXISTS portfolio_snapshots (
     id SERIAL PRIMARY KEY,
-    cash NUMERIC(14,2),
-    positions_value NUMERIC(14,2),
-    total_value NUMERIC(14,2),
+    cash INTEGER,
+    positions_value INTEGER,
+    total_value INTEGER,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+-- Indexes backing the dashboard's ORDER BY created_at DESC LIMIT queries
+CREATE INDEX IF NOT EXISTS ix_decisions_created_at ON decisions (created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_decisions_action_created_at ON decisions (action, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_portfolio_snapshots_created_at ON portfolio_snapshots (created_at DESC);
+
 -- Seed the BTC 15m strategy
 INSERT INTO strategies (name, description, enabled, config) VALUES (
     'btc_15m_high_confidence',